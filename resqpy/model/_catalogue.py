@@ -25,8 +25,16 @@ def _parts(model,
            sort_by = None):
     """Returns a list of parts matching all of the arguments passed."""
 
+    if obj_type and obj_type[0].isupper():
+        obj_type = 'obj_' + obj_type
     if not parts_list:
-        parts_list = _list_of_parts(model)
+        if obj_type and uuid is None and not epc_subdir:
+            parts_list = list(model.type_parts_dict.get(obj_type, ()))
+            if len(parts_list) == 0:
+                return []
+            obj_type = None  # already filtered by type
+        else:
+            parts_list = _list_of_parts(model)
     if uuid is not None:
         part_name = model.uuid_part_dict.get(bu.uuid_as_int(uuid))
         if part_name is None or part_name not in parts_list:
@@ -35,8 +43,6 @@ def _parts(model,
     if epc_subdir:
         parts_list = _filtered_by_epc_subdir(model, parts_list, epc_subdir)
     if obj_type:
-        if obj_type[0].isupper():
-            obj_type = 'obj_' + obj_type
         filtered_list = []
         for part in parts_list:
             if model.parts_forest[part][0] == obj_type:
@@ -598,10 +604,18 @@ def _title_for_part(model, part_name):  # duplicate functionality to citation_ti
     return _title_for_root(model, _root_for_part(model, part_name))
 
 
+def _uuids_of_type(model, obj_type):
+    """Returns a list of uuids of the object parts of the given type, without scanning all parts."""
+
+    if obj_type[0].isupper():
+        obj_type = 'obj_' + obj_type
+    return [model.parts_forest[part][1] for part in model.type_parts_dict.get(obj_type, ())]
+
+
 def _iter_objs(model, cls):
     """Iterate over all available objects of given resqpy class within the model."""
 
-    uuids = _uuids(model, obj_type = cls.resqml_type)
+    uuids = _uuids_of_type(model, cls.resqml_type)
     for uuid in uuids:
         yield cls(model, uuid = uuid)
 
@@ -611,7 +625,7 @@ def _iter_grid_connection_sets(model):
 
     import resqpy.fault as rqf  # imported here for speed, module is not always needed
 
-    gcs_uuids = _uuids(model, obj_type = 'GridConnectionSetRepresentation')
+    gcs_uuids = _uuids_of_type(model, 'GridConnectionSetRepresentation')
     for gcs_uuid in gcs_uuids:
         yield rqf.GridConnectionSet(model, uuid = gcs_uuid)
 
@@ -621,7 +635,7 @@ def _iter_wellbore_interpretations(model):
 
     import resqpy.organize as rqo  # imported here for speed, module is not always needed
 
-    uuids = _uuids(model, obj_type = 'WellboreInterpretation')
+    uuids = _uuids_of_type(model, 'WellboreInterpretation')
     if uuids:
         for uuid in uuids:
             yield rqo.WellboreInterpretation(model, uuid = uuid)
@@ -632,7 +646,7 @@ def _iter_trajectories(model):
 
     import resqpy.well as rqw  # imported here for speed, module is not always needed
 
-    uuids = _uuids(model, obj_type = "WellboreTrajectoryRepresentation")
+    uuids = _uuids_of_type(model, "WellboreTrajectoryRepresentation")
     for uuid in uuids:
         yield rqw.Trajectory(model, uuid = uuid)
 
@@ -642,7 +656,7 @@ def _iter_md_datums(model):
 
     import resqpy.well as rqw  # imported here for speed, module is not always needed
 
-    uuids = _uuids(model, obj_type = 'MdDatum')
+    uuids = _uuids_of_type(model, 'MdDatum')
     if uuids:
         for uuid in uuids:
             datum = rqw.MdDatum(model, uuid = uuid)
@@ -654,7 +668,7 @@ def _iter_crs(model):
 
     import resqpy.crs as rqc  # imported here for speed, module is not always needed
 
-    uuids = _uuids(model, obj_type = 'LocalDepth3dCrs') + _uuids(model, obj_type = 'LocalTime3dCrs')
+    uuids = _uuids_of_type(model, 'LocalDepth3dCrs') + _uuids_of_type(model, 'LocalTime3dCrs')
     if uuids:
         for uuid in uuids:
             yield rqc.Crs(model, uuid = uuid)
@@ -682,22 +696,28 @@ def _as_graph(model, uuids_subset = None):
     """Return representation of model as nodes and edges, suitable for plotting in a graph."""
 
     nodes = {}
-    edges = set()
+    int_edges = set()
 
     if uuids_subset is None:
         uuids_subset = _uuids(model)
 
-    uuids_subset = set(map(str, uuids_subset))
+    # work with uuid ints, as held in the relationships dictionary, converting to strings once per node
+    uuid_str_dict = {bu.uuid_as_int(uuid): str(uuid) for uuid in uuids_subset}
 
-    for uuid in uuids_subset:
-        part = _part_for_uuid(model, uuid)
+    for uuid_int, uuid in uuid_str_dict.items():
+        part = model.uuid_part_dict.get(uuid_int)
         nodes[uuid] = dict(
             resqml_type = _type_of_part(model, part, strip_obj = True),
             title = _citation_title_for_part(model, part),
         )
-        for rel in map(str, _uuids(model, related_uuid = uuid)):
-            if rel in uuids_subset:
-                edges.add(frozenset([uuid, rel]))
+        relations = model.uuid_rels_dict.get(uuid_int)
+        if relations is None:
+            continue
+        for rel_int in relations[0] | relations[1] | relations[2]:
+            if rel_int in uuid_str_dict and rel_int in model.uuid_part_dict:
+                int_edges.add((uuid_int, rel_int) if uuid_int < rel_int else (rel_int, uuid_int))
+
+    edges = set(frozenset([uuid_str_dict[a], uuid_str_dict[b]]) for a, b in int_edges)
 
     return nodes, edges
 
@@ -22,6 +22,27 @@ from resqpy.olio.xml_namespaces import namespace as ns_url
 def _add_to_object_parts(model, part):
     if m_c._obj_part(part) is not None:
         model.object_parts[part] = None
+        _add_to_type_parts(model, part)
+
+
+def _add_to_type_parts(model, part):
+    part_type = model.parts_forest[part][0]
+    if part_type is not None:
+        model.type_parts_dict.setdefault(part_type, {})[part] = None
+
+
+def _del_from_type_parts(model, part):
+    # note: searches all types, as the type in the parts forest may already have been lost
+    for type_parts in model.type_parts_dict.values():
+        type_parts.pop(part, None)
+
+
+def _set_type_parts_dict(model):
+    """Rebuilds the dictionary of object parts by type, with parts ordered as in the object parts dictionary."""
+
+    model.type_parts_dict = {}
+    for part in model.object_parts:
+        _add_to_type_parts(model, part)
 
 
 def _load_part(model, epc, part_name, is_rels = None):
@@ -87,6 +108,7 @@ def _fell_part(model, part_name):
         _del_uuid_relations(model, part_name)
     except Exception:
         pass
+    _del_from_type_parts(model, part_name)
     try:
         del model.parts_forest[part_name]
         model.object_parts.pop(part_name)
@@ -128,6 +150,7 @@ def _tidy_up_forests(model, tidy_main_tree = True, tidy_others = False, remove_e
         if tidy_main_tree:
             _remove_part_from_main_tree(model, part)
         _del_uuid_to_part(model, part)
+        _del_from_type_parts(model, part)
         del model.parts_forest[part]
         model.object_parts.pop(part)
     deletion_list = []
@@ -189,6 +212,8 @@ def _load_epc(model, epc_file, full_load = True, epc_subdir = None, copy_from =
         if full_load:
             _tidy_up_forests(model)
 
+    _set_type_parts_dict(model)
+
     if full_load:
         for uuid_int, part in model.uuid_part_dict.items():
             _add_uuid_relations(model, uuid_int, part)
@@ -197,6 +222,39 @@ def _load_epc(model, epc_file, full_load = True, epc_subdir = None, copy_from =
             _add_uuid_soft_relations(model, uuid_int, part)
 
 
+def _reopen_in_memory(model):
+    """Returns a new Model populated from copies of the catalogue and parsed xml already held in memory."""
+
+    def tree_copy(tree):
+        return None if tree is None else copy.deepcopy(tree)
+
+    clone = model.__class__()
+    clone.epc_file = model.epc_file
+    clone.epc_directory = model.epc_directory
+    clone.h5_dict = model.h5_dict.copy()
+    clone.default_h5_override = model.default_h5_override
+    clone.main_h5_uuid = model.main_h5_uuid
+    clone.crs_uuid = model.crs_uuid
+    clone.main_tree = tree_copy(model.main_tree)
+    clone.main_root = None if clone.main_tree is None else clone.main_tree.getroot()
+    clone.parts_forest = {
+        part: (part_type, part_uuid, tree_copy(tree))
+        for part, (part_type, part_uuid, tree) in model.parts_forest.items()
+    }
+    clone.rels_present = model.rels_present
+    clone.rels_forest = {part: (part_uuid, tree_copy(tree)) for part, (part_uuid, tree) in model.rels_forest.items()}
+    clone.other_forest = {part: (part_type, tree_copy(tree)) for part, (part_type, tree) in model.other_forest.items()}
+    clone.uuid_part_dict = model.uuid_part_dict.copy()
+    clone.uuid_rels_dict = {
+        uuid_int: (set(depends_on), set(depended_on_by), set(soft))
+        for uuid_int, (depends_on, depended_on_by, soft) in model.uuid_rels_dict.items()
+    }
+    clone.object_parts = model.object_parts.copy()
+    clone.type_parts_dict = {part_type: parts.copy() for part_type, parts in model.type_parts_dict.items()}
+    clone.modified = model.modified
+    return clone
+
+
 def _add_uuid_soft_relations(model, uuid_int, part):
     if "EpcExternalPart" in part:
         return
@@ -488,6 +546,7 @@ def _remove_part(model, part_name, remove_relationship_part):
         model.rels_forest.pop(rels_part_name)
     _del_uuid_to_part(model, part_name)
     _del_uuid_relations(model, part_name)
+    _del_from_type_parts(model, part_name)
     model.parts_forest.pop(part_name)
     model.object_parts.pop(part_name)
     _remove_part_from_main_tree(model, part_name)
@@ -541,8 +600,14 @@ def _copy_part_from_other_model(model,
                                 h5_uuid = None,
                                 other_h5_file_name = None,
                                 hdf5_copy_needed = True,
-                                uuid_int = None):
-    """Fully copies part in from another model, with referenced parts, hdf5 data and relationships."""
+                                uuid_int = None,
+                                h5_path_list = None):
+    """Fully copies part in from another model, with referenced parts, hdf5 data and relationships.
+
+    note:
+       if h5_path_list is not None, hdf5 internal paths needing to be copied are appended to it instead of the
+       hdf5 data being copied immediately; the caller must then copy the listed datasets
+    """
 
     # todo: double check behaviour around equivalent CRSes, especially any default crs in model
 
@@ -574,7 +639,14 @@ def _copy_part_from_other_model(model,
         if hdf5_copy_needed:
             # copy hdf5 data
             hdf5_internal_paths = [node.text for node in rqet.list_of_descendant_tag(other_root, 'PathInHdfFile')]
-            hdf5_count = whdf5.copy_h5_path_list(other_h5_file_name, self_h5_file_name, hdf5_internal_paths, mode = 'a')
+            if h5_path_list is None:
+                hdf5_count = whdf5.copy_h5_path_list(other_h5_file_name,
+                                                     self_h5_file_name,
+                                                     hdf5_internal_paths,
+                                                     mode = 'a')
+            else:
+                h5_path_list += hdf5_internal_paths
+                hdf5_count = len(hdf5_internal_paths)
             # create relationship with hdf5 if needed and modify h5 file uuid in xml references
             _copy_part_hdf5_setup(model, hdf5_count, h5_uuid, root_node)
         # NB. assumes ext part is already established when sharing a common hdf5 file
@@ -591,7 +663,8 @@ def _copy_part_from_other_model(model,
 
         # recursively copy in referenced parts where they don't already exist in this model
         _copy_referenced_parts(model, other_model, realization, consolidate, force, cut_refs_to_uuids, cut_node_types,
-                               self_h5_file_name, h5_uuid, other_h5_file_name, root_node, uuid, hdf5_copy_needed)
+                               self_h5_file_name, h5_uuid, other_h5_file_name, root_node, uuid, hdf5_copy_needed,
+                               h5_path_list)
 
         _add_uuid_relations(model, uuid.int, part)
 
@@ -646,7 +719,8 @@ def _copy_part_hdf5_setup(model, hdf5_count, h5_uuid, root_node):
 
 
 def _copy_referenced_parts(model, other_model, realization, consolidate, force, cut_refs_to_uuids, cut_node_types,
-                           self_h5_file_name, h5_uuid, other_h5_file_name, root_node, uuid, hdf5_copy_needed):
+                           self_h5_file_name, h5_uuid, other_h5_file_name, root_node, uuid, hdf5_copy_needed,
+                           h5_path_list):
     # uuid = rqet.uuid_for_part_root(root_node)
     reference_node_dict = None
     relatives = other_model.uuid_rels_dict.get(uuid.int)
@@ -678,7 +752,8 @@ def _copy_referenced_parts(model, other_model, realization, consolidate, force,
                                                         h5_uuid = h5_uuid,
                                                         other_h5_file_name = other_h5_file_name,
                                                         hdf5_copy_needed = hdf5_copy_needed,
-                                                        uuid_int = ref_uuid_int)
+                                                        uuid_int = ref_uuid_int,
+                                                        h5_path_list = h5_path_list)
             if resident_part == referred_part:
                 continue
         if consolidate and model.consolidation is not None and ref_uuid_int in model.consolidation.map:
@@ -752,6 +827,8 @@ def _copy_all_parts_from_other_model(model, other_model, realization = None, con
     self_h5_uuid = model.h5_uuid()
     other_h5_file_name = other_model.h5_file_name()
     hdf5_copy_needed = not os.path.samefile(self_h5_file_name, other_h5_file_name)
+    # hdf5 internal paths are gathered for all parts and then copied with both hdf5 files opened just once
+    h5_path_list = [] if hdf5_copy_needed else None
 
     for uuid_int in other_uuid_ints_list:
         if uuid_int in model.uuid_part_dict:
@@ -768,7 +845,11 @@ def _copy_all_parts_from_other_model(model, other_model, realization = None, con
                                     h5_uuid = self_h5_uuid,
                                     other_h5_file_name = other_h5_file_name,
                                     hdf5_copy_needed = hdf5_copy_needed,
-                                    uuid_int = uuid_int)
+                                    uuid_int = uuid_int,
+                                    h5_path_list = h5_path_list)
+
+    if h5_path_list:
+        whdf5.copy_h5_path_list(other_h5_file_name, self_h5_file_name, h5_path_list, mode = 'a')
 
     if consolidate and model.consolidation is not None:
         model.consolidation.check_map_integrity()
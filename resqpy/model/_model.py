@@ -173,6 +173,7 @@ class Model():
         self.consolidation = None  # Consolidation object for mapping equivalent uuids
         self.modified = False
         self.object_parts = {}  # Dictionary for model object parts that aren't epc refs.
+        self.type_parts_dict = {}  # dictionary keyed on object type; mapping to dictionary of object parts of that type
 
     def parts(self,
               parts_list = None,
@@ -689,6 +690,23 @@ class Model():
                       copy_from = copy_from,
                       quiet = quiet)
 
+    def reopen_in_memory(self):
+        """Returns a new Model equivalent to this one, built from the xml already parsed in memory.
+
+        returns:
+           a new Model object with its own deep copies of the xml trees and catalogue dictionaries of this model
+
+        notes:
+           this is a faster alternative to storing and then re-opening an epc file, as no xml is re-parsed;
+           the new model reflects the in-memory state of this model, including any unsaved modifications;
+           hdf5 data is not copied, the new model refers to the same hdf5 file(s) as this model;
+           resqpy objects such as grids and time series cached by this model are not carried over
+
+        :meta common:
+        """
+
+        return m_f._reopen_in_memory(self)
+
     def store_epc(self,
                   epc_file = None,
                   main_xml_name = '[Content_Types].xml',
@@ -184,7 +184,15 @@ class BaseResqpy(metaclass = ABCMeta):
     # Generic magic methods
 
     def __eq__(self, other):
-        """Implements equals operator; uses is_equivalent() otherwise compares class type and uuid."""
+        """Implements equals operator; uses is_equivalent() otherwise compares class type and uuid.
+
+        note:
+           objects of the same class with the same uuid are equal without calling is_equivalent(), so any
+           is_equivalent() method in a derived class must also treat matching uuids as equivalent
+        """
+        if self is other or (type(self) is type(other) and self.uuid is not None and other.uuid is not None and
+                             bu.uuid_as_int(self.uuid) == bu.uuid_as_int(other.uuid)):
+            return True
         if hasattr(self, 'is_equivalent'):
             return self.is_equivalent(other)
         if not isinstance(other, self.__class__):
@@ -95,27 +95,31 @@ class RelPerm(DataFrame):
             # convert all values in the dataframe to numeric type
             df[df.columns] = df[df.columns].apply(pd.to_numeric, errors = 'coerce')
             # ensure that no other column besides Pc has missing values
-            cols_no_pc = [x for x in df.columns if 'Pc' != x]
-            for col in cols_no_pc:
-                if (df[col].isnull().sum() > 0) or ('None' in list(df[col])):
-                    raise Exception(f'missing values found in {col} column')
+            cols = list(df.columns)
+            arr = df.to_numpy(dtype = float)
+            cols_no_pc = [i for i, x in enumerate(cols) if 'Pc' != x]
+            missing = np.isnan(arr[:, cols_no_pc]).any(axis = 0)
+            if np.any(missing):
+                raise Exception(f'missing values found in {cols[cols_no_pc[np.argmax(missing)]]} column')
 
             # check that Sw, Kr and Pc values are monotonic and that the Sw and Kr values are within the range 0-1
-            sat_col = [x for x in df.columns if x[0] == 'S'][0]
-            relp_corr_col = [x for x in df.columns if x == 'Kr' + sat_col[-1]][0]
-            relp_opp_col = [x for x in df.columns if (x[0:2] == 'Kr') & (x[-1] != sat_col[-1])][0]
-            if (not (df[sat_col].is_monotonic_increasing and df[relp_corr_col].is_monotonic_increasing and
-                     df[relp_opp_col].is_monotonic_decreasing) and
-                    not (df[sat_col].is_monotonic_decreasing and df[relp_corr_col].is_monotonic_decreasing and
-                         df[relp_opp_col].is_monotonic_increasing)):
+            sat_col = [x for x in cols if x[0] == 'S'][0]
+            relp_corr_col = [x for x in cols if x == 'Kr' + sat_col[-1]][0]
+            relp_opp_col = [x for x in cols if (x[0:2] == 'Kr') & (x[-1] != sat_col[-1])][0]
+            sat_inc, sat_dec = _monotonicity(arr[:, cols.index(sat_col)])
+            corr_inc, corr_dec = _monotonicity(arr[:, cols.index(relp_corr_col)])
+            opp_inc, opp_dec = _monotonicity(arr[:, cols.index(relp_opp_col)])
+            if not (sat_inc and corr_inc and opp_dec) and not (sat_dec and corr_dec and opp_inc):
                 raise ValueError(f'{sat_col, relp_corr_col, relp_opp_col} combo is not monotonic')
-            if 'Pc' in df.columns:
-                if not df['Pc'].dropna().is_monotonic_increasing and not df['Pc'].dropna().is_monotonic_decreasing:
+            if 'Pc' in cols:
+                pc = arr[:, cols.index('Pc')]
+                if not any(_monotonicity(pc[~np.isnan(pc)])):
                     raise ValueError('Pc values are not monotonic')
-            for col in ['Sw', 'Sg', 'So', 'Krw', 'Krg', 'Kro']:
-                if col in df.columns:
-                    if df[col].min() < 0 or df[col].max() > 1:
-                        raise ValueError(f'{col} is not within the range 0-1')
+            range_cols = [x for x in ['Sw', 'Sg', 'So', 'Krw', 'Krg', 'Kro'] if x in cols]
+            range_arr = arr[:, [cols.index(x) for x in range_cols]]
+            out_of_range = np.logical_or(range_arr < 0.0, range_arr > 1.0).any(axis = 0)
+            if np.any(out_of_range):
+                raise ValueError(f'{range_cols[np.argmax(out_of_range)]} is not within the range 0-1')
 
         super().__init__(model,
                          uuid = uuid,
@@ -251,6 +255,12 @@ class RelPerm(DataFrame):
         rqet.create_metadata_xml(mesh_root, self.extra_metadata)
 
 
+def _monotonicity(a):
+    """Returns pair of booleans indicating whether 1D array is monotonically (non-strictly) increasing, decreasing."""
+    diff = np.diff(a)
+    return bool(np.all(diff >= 0.0)), bool(np.all(diff <= 0.0))
+
+
 def text_to_relperm_dict(relperm_data, is_file = True):
     """Return dict of dataframes with relative permeability and capillary pressure data and phase combinations.
 
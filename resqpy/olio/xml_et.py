@@ -11,7 +11,7 @@ import uuid
 # import xml element tree parse method and classes here to allow single point for switching between lxml and etree
 # alternative to lxml.etree: xml.etree.ElementTree
 from lxml.etree import (  # type: ignore
-    Element, ElementTree, SubElement, _Element,  # noqa
+    Element, ElementTree, SubElement, XPath, _Element,  # noqa
     parse)
 
 import resqpy.olio.uuid as bu
@@ -66,7 +66,6 @@ def colon_prefixed(curly_prefixed):
     return pre_colon + ':' + curly_prefixed[pre_end + 1:], pre_colon
 
 
-@lru_cache()
 def match(xml_name, name):
     """Returns True if the xml_name stripped of prefix matches name."""
     i = len(xml_name) - len(name)
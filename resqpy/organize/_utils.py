@@ -1,37 +1,43 @@
 """Helper functions for RESQML Feature and Interpretation classes."""
 
+from operator import attrgetter
+
 import resqpy.olio.xml_et as rqet
 from resqpy.olio.xml_namespaces import curly_namespace as ns
+from resqpy.olio.xml_namespaces import namespace as ns_url
+
+_CHRONO_XPATH_NAMESPACES = {'r': ns_url['resqml2'], 'e': ns_url['eml']}
+
+_XSI_TYPE_ATTR = ns['xsi'] + 'type'
+_TIME_INTERVAL_TYPE = ns['resqml2'] + 'TimeInterval'
+_SENTINEL = object()
 
 
 def alias_for_attribute(attribute_name):
     """Return an attribute that is a direct alias for an existing attribute."""
 
-    def fget(self):
-        return getattr(self, attribute_name)
-
     def fset(self, value):
         return setattr(self, attribute_name, value)
 
-    return property(fget, fset, doc = f"Alias for {attribute_name}")
+    # attrgetter is implemented in C, avoiding a python frame for each read of the alias
+    return property(attrgetter(attribute_name), fset, doc = f"Alias for {attribute_name}")
+
+
+def _em_of(obj):
+    """Returns the extra metadata dictionary for obj, loading from xml if obj has no extra_metadata attribute."""
+    em = getattr(obj, 'extra_metadata', _SENTINEL)
+    if em is not _SENTINEL:
+        return em
+    em = rqet.load_metadata_from_xml(obj.root)
+    return {} if em is None else em
 
 
 def equivalent_extra_metadata(a, b):
     """Returns True if the two objects have identical extra metadata"""
-    a_has = hasattr(a, 'extra_metadata')
-    b_has = hasattr(b, 'extra_metadata')
-    if a_has:
-        a_em = a.extra_metadata
-        a_has = len(a_em) > 0
-    else:
-        a_em = rqet.load_metadata_from_xml(a.root)
-        a_has = a_em is not None and len(a_em) > 0
-    if b_has:
-        b_em = b.extra_metadata
-        b_has = len(b_em) > 0
-    else:
-        b_em = rqet.load_metadata_from_xml(b.root)
-        b_has = b_em is not None and len(b_em) > 0
+    a_em = _em_of(a)
+    b_em = _em_of(b)
+    a_has = len(a_em) > 0
+    b_has = len(b_em) > 0
     if a_has != b_has:
         return False
     if not a_has:
@@ -39,28 +45,44 @@ def equivalent_extra_metadata(a, b):
     return a_em == b_em
 
 
+def _chrono_uuid_xpath(chrono_tag):
+    return rqet.XPath(f'./r:{chrono_tag}/e:UUID/text()', namespaces = _CHRONO_XPATH_NAMESPACES)
+
+
+_XP_BOTTOM = _chrono_uuid_xpath('ChronoBottom')
+_XP_TOP = _chrono_uuid_xpath('ChronoTop')
+
+
+def _first_stripped_text(text_list):
+    if not text_list:
+        return None
+    text = text_list[0].strip()
+    return text if text else None
+
+
 def extract_has_occurred_during(parent_node, tag = 'HasOccuredDuring'):  # RESQML Occured (stet)
     """Extracts UUIDs of chrono bottom and top from xml for has occurred during sub-node, or (None, None)."""
     hod_node = rqet.find_tag(parent_node, tag)
     if hod_node is None:
         return (None, None)
-    else:
-        return (rqet.find_nested_tags_text(hod_node, ['ChronoBottom', 'UUID']),
-                rqet.find_nested_tags_text(hod_node, ['ChronoTop', 'UUID']))
+    base_chrono_uuid = _first_stripped_text(_XP_BOTTOM(hod_node))
+    top_chrono_uuid = _first_stripped_text(_XP_TOP(hod_node))
+    if base_chrono_uuid is None or top_chrono_uuid is None:
+        # fall back to prefix agnostic search, for references outside the standard namespaces
+        base_chrono_uuid = rqet.find_nested_tags_text(hod_node, ['ChronoBottom', 'UUID'])
+        top_chrono_uuid = rqet.find_nested_tags_text(hod_node, ['ChronoTop', 'UUID'])
+    return (base_chrono_uuid, top_chrono_uuid)
 
 
 def equivalent_chrono_pairs(pair_a, pair_b, model = None):
     """Returns True if the two chronostratigraphic pairs are equivalent"""
-    if pair_a == pair_b:
+    if pair_a is pair_b:
         return True
-    if pair_a is None or pair_b is None:
-        return False
-    if pair_a == (None, None) or pair_b == (None, None):
+    if not pair_a or not pair_b:
         return False
-    if model is not None:
-        # todo: compare chrono info by looking up xml based on the uuids
-        pass
-    return False  # cautious
+    # todo: if model is given, compare chrono info for differing uuids by looking up xml;
+    # until then, pairs with differing uuids are cautiously treated as not equivalent
+    return pair_a == pair_b
 
 
 def create_xml_has_occurred_during(model, parent_node, hod_pair, tag = 'HasOccuredDuring'):
@@ -71,7 +93,7 @@ def create_xml_has_occurred_during(model, parent_node, hod_pair, tag = 'HasOccur
     if base_chrono_uuid is None or top_chrono_uuid is None:
         return
     hod_node = rqet.SubElement(parent_node, tag)
-    hod_node.set(ns['xsi'] + 'type', ns['resqml2'] + 'TimeInterval')
+    hod_node.set(_XSI_TYPE_ATTR, _TIME_INTERVAL_TYPE)
     hod_node.text = rqet.null_xml_text
     chrono_base_root = model.root_for_uuid(base_chrono_uuid)
     chrono_top_root = model.root_for_uuid(top_chrono_uuid)
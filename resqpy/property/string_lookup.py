@@ -46,6 +46,7 @@ class StringLookup(BaseResqpy):
         self.str_list = []
         self.str_dict = {}
         self.stored_as_list = False
+        self._str_to_int = None  # reverse lookup, populated when first needed
         super().__init__(model = parent_model,
                          uuid = uuid,
                          title = title,
@@ -74,6 +75,7 @@ class StringLookup(BaseResqpy):
             return
         assert len(int_to_str_dict), 'empty dictionary passed to string lookup initialisation'
         self.str_dict = int_to_str_dict.copy()
+        self._str_to_int = None
         self.min_index = min(self.str_dict.keys())
         self.max_index = max(self.str_dict.keys())
         self.set_list_from_dict_conditionally()
@@ -113,12 +115,13 @@ class StringLookup(BaseResqpy):
         """Sets the string associated with a given integer key."""
 
         self.str_dict[key] = value
+        self._str_to_int = None
         limits_changed = False
-        if self.min_index is None or value < self.min_index:
-            self.min_index = value
+        if self.min_index is None or key < self.min_index:
+            self.min_index = key
             limits_changed = True
-        if self.max_index is None or value > self.max_index:
-            self.max_index = value
+        if self.max_index is None or key > self.max_index:
+            self.max_index = key
             limits_changed = True
         if self.stored_as_list:
             if limits_changed:
@@ -132,13 +135,9 @@ class StringLookup(BaseResqpy):
         :meta common:
         """
 
-        if key < self.min_index or key > self.max_index:
-            return None
         if self.stored_as_list:
-            return self.str_list[key]
-        if key not in self.str_dict:
-            return None
-        return self.str_dict[key]
+            return self.str_list[key] if 0 <= key < len(self.str_list) else None
+        return self.str_dict.get(key)
 
     def get_list(self):
         """Returns a list of values, sorted by key.
@@ -166,18 +165,19 @@ class StringLookup(BaseResqpy):
         :meta common:
         """
 
+        if self._str_to_int is None:
+            self._set_reverse_dict()
+        return self._str_to_int.get(string)
+
+    def _set_reverse_dict(self):
+        # first occurrence of a string takes precedence, matching the order of a linear search
         if self.stored_as_list:
-            try:
-                index = self.str_list.index(string)
-                return index
-            except Exception:
-                return None
-        if string not in self.str_dict.values():
-            return None
-        for k, v in self.str_dict.items():
-            if v == string:
-                return k
-        return None
+            items = enumerate(self.str_list)
+        else:
+            items = self.str_dict.items()
+        self._str_to_int = {}
+        for k, v in items:
+            self._str_to_int.setdefault(v, k)
 
     def create_xml(self, title = None, originator = None, add_as_part = True, reuse = True):
         """Creates an xml node for the string table lookup.
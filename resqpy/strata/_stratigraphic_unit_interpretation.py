@@ -139,6 +139,8 @@ class StratigraphicUnitInterpretation(rqsgui.GeologicUnitInterpretation):
         """
         if not super().is_equivalent(other):
             return False
+        if self is other or bu.matching_uuids(self.uuid, other.uuid):
+            return True
         if self.deposition_mode is not None and other.deposition_mode is not None:
             return self.deposition_mode == other.deposition_mode
         # note: thickness range information might be lost as not deemed of significance in comparison
@@ -157,10 +157,16 @@ class MdDatum(BaseResqpy):
         return datum
 
     def is_equivalent(self, other):
-        """Implements equals operator, comparing metadata items deemed significant."""
+        """Implements equals operator, comparing metadata items deemed significant.
+
+        note:
+           a datum with the same uuid as this one is always deemed equivalent, in keeping with other resqpy classes
+        """
 
         if not isinstance(other, self.__class__):
             return False
+        if self is other or bu.matching_uuids(self.uuid, other.uuid):
+            return True
         if self.md_reference != other.md_reference or not np.allclose(self.location, other.location):
             return False
         return bu.matching_uuids(self.crs_uuid, other.crs_uuid)
@@ -99,6 +99,12 @@ def test_model_iter_crs(example_model_and_crs):
     crs_2 = crs_list[0]
     assert crs_2 == crs_1
 
+    crs_3 = rqc.Crs(model, title = 'second crs', z_inc_down = False)
+    crs_3.create_xml()
+    crs_list = list(model.iter_crs())
+    assert [crs.uuid for crs in crs_list] == model.uuids(obj_type = 'LocalDepth3dCrs')
+    assert crs_list[-1] == crs_3
+
 
 def test_model_iter_crs_empty(tmp_model):
 
@@ -125,6 +131,11 @@ def test_model_as_graph(example_model_with_well):
     assert frozenset([str(traj.uuid), str(crs.uuid)]) in edges
     assert frozenset([str(traj.uuid), str(well_interp.uuid)]) in edges
     assert frozenset([str(datum.uuid), str(traj.uuid)]) in edges
+    expected_edges = set()
+    for uuid in model.uuids():
+        for rel in model.uuids(related_uuid = uuid):
+            expected_edges.add(frozenset([str(uuid), str(rel)]))
+    assert edges == expected_edges
 
     # Test uuid subset
     nodes, edges = model.as_graph(uuids_subset = [datum.uuid])
@@ -709,6 +720,27 @@ def test_forestry(example_model_with_prop_ts_rels):
     assert len(model.parts()) + len(dp_parts_list) + 1 == len(full_parts_list)
 
 
+def test_type_parts_dict(example_model_with_prop_ts_rels):
+    model = example_model_with_prop_ts_rels
+
+    def scanned_parts(obj_type):
+        return [p for p in model.parts() if model.type_of_part(p) == obj_type]
+
+    dp_parts_list = model.parts(obj_type = 'DiscreteProperty')
+    assert len(dp_parts_list) > 1
+    assert dp_parts_list == scanned_parts('obj_DiscreteProperty')
+    reloaded = rq.Model(model.epc_file)
+    assert reloaded.parts(obj_type = 'obj_DiscreteProperty') == scanned_parts('obj_DiscreteProperty')
+    # check that removal and addition of parts are reflected
+    model.remove_part(dp_parts_list[0])
+    assert model.parts(obj_type = 'DiscreteProperty') == dp_parts_list[1:]
+    datum = rqw.MdDatum(model, location = (0.0, 0.0, 0.0), crs_uuid = model.uuid(obj_type = 'LocalDepth3dCrs'))
+    datum.create_xml(title = 'new datum')
+    assert model.part(obj_type = 'MdDatum', title = 'datum', title_mode = 'ends') == datum.part
+    assert model.parts(obj_type = 'MdDatum') == scanned_parts('obj_MdDatum')
+    assert model.parts(obj_type = 'NoSuchRepresentation') == []
+
+
 def test_copy_from(example_model_with_prop_ts_rels):
     original_epc = example_model_with_prop_ts_rels.epc_file
     copied_epc = original_epc[:-4] + '_copy.epc'
@@ -719,6 +751,26 @@ def test_copy_from(example_model_with_prop_ts_rels):
     assert model.parts(sort_by = 'oldest') == parts_list
 
 
+def test_reopen_in_memory(example_model_with_properties):
+    model = example_model_with_properties
+    model.store_epc()
+    reopened = model.reopen_in_memory()
+    assert reopened is not model
+    assert reopened.epc_file == model.epc_file
+    assert reopened.parts(sort_by = 'oldest') == model.parts(sort_by = 'oldest')
+    assert reopened.uuid_rels_dict == model.uuid_rels_dict
+    zone_uuid = model.uuid(obj_type = 'DiscreteProperty', title = 'Zone')
+    assert reopened.root(uuid = zone_uuid) is not model.root(uuid = zone_uuid)
+    zone = rqp.Property(model, uuid = zone_uuid)
+    reopened_zone = rqp.Property(reopened, uuid = zone_uuid)
+    assert np.array_equal(reopened_zone.array_ref(), zone.array_ref())
+    # check that the xml and catalogue of the reopened model are independent of the original
+    reopened.remove_part(reopened.part_for_uuid(zone_uuid))
+    assert reopened.part_for_uuid(zone_uuid) is None
+    assert model.part_for_uuid(zone_uuid) is not None
+    assert model.root(uuid = zone_uuid) is not None
+
+
 def test_h5_array_element(example_model_with_properties):
     model = example_model_with_properties
     zone_root = model.root(obj_type = 'DiscreteProperty', title = 'Zone')
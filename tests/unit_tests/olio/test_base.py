@@ -67,6 +67,29 @@ def test_base_comparison(tmp_model):
     assert dummy1 != dummy3
 
 
+def test_base_comparison_same_uuid_skips_is_equivalent(tmp_model):
+
+    class FussyDummyObj(BaseResqpy):
+        resqml_type = 'FussyDummyResqmlInterpretation'
+
+        # follows the convention that matching uuids are equivalent, otherwise finds nothing equivalent
+        def is_equivalent(self, other):
+            self.equivalence_checked = True
+            return isinstance(other, FussyDummyObj) and bu.matching_uuids(self.uuid, other.uuid)
+
+    dummy1 = FussyDummyObj(model = tmp_model, title = 'fussy')
+    dummy1.create_xml(add_as_part = True)
+    dummy2 = FussyDummyObj(model = tmp_model, uuid = dummy1.uuid)
+    dummy3 = FussyDummyObj(model = tmp_model, title = 'fussy')
+
+    # objects of the same class with the same uuid are equal without calling is_equivalent()
+    assert dummy1 == dummy2
+    assert not hasattr(dummy1, 'equivalence_checked')
+    assert dummy1 != dummy3
+    assert dummy1.equivalence_checked
+    assert dummy1 != DummyObj(model = tmp_model, uuid = dummy1.uuid)
+
+
 def test_base_repr(tmp_model):
 
     dummy = DummyObj(model = tmp_model)
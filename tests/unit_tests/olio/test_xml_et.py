@@ -49,3 +49,28 @@ def test_print_xml_tree(example_model_with_well):
                                 max_lines = 20,
                                 line_count = 0)
     assert lines == 21
+
+
+def test_find_tag_any_namespace():
+    root = rqet.Element('{http://example.com/a}Root')
+    rqet.SubElement(root, '{http://example.com/a}First')
+    b = rqet.SubElement(root, '{http://example.com/b}Second')
+    plain = rqet.SubElement(root, 'Third')
+
+    assert rqet.find_tag(root, 'Second') is b
+    assert rqet.find_tag(root, '{http://example.com/b}Second') is b
+    assert rqet.find_tag(root, 'Third') is plain
+    assert rqet.find_tag(root, 'Fourth') is None
+    assert rqet.find_tag(None, 'Second') is None
+    with pytest.raises(ValueError):
+        rqet.find_tag(root, 'Fourth', must_exist = True)
+
+
+def test_load_metadata_from_xml():
+    root = rqet.Element('{http://example.com/a}Root')
+    rqet.SubElement(root, '{http://example.com/a}Citation')
+    rqet.create_metadata_xml(root, {'colour': 'blue', 'count': 3})
+
+    assert rqet.load_metadata_from_xml(root) == {'colour': 'blue', 'count': '3'}
+    assert rqet.load_metadata_from_xml(rqet.Element('Empty')) == {}
+    assert rqet.load_metadata_from_xml(None) is None
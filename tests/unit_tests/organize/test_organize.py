@@ -2,7 +2,10 @@ import pytest
 
 import resqpy.organize as rqo
 from resqpy.model import Model
-from resqpy.organize._utils import equivalent_extra_metadata, equivalent_chrono_pairs
+import resqpy.olio.xml_et as rqet
+from resqpy.olio.xml_namespaces import curly_namespace as ns
+from resqpy.organize._utils import (equivalent_extra_metadata, equivalent_chrono_pairs, extract_has_occurred_during,
+                                    alias_for_attribute)
 
 
 # Test saving and loading from disk
@@ -205,6 +208,43 @@ def test_wellbore_interp_title(tmp_model):
     assert well_interp_2.title == feature_name
 
 
+def test_alias_for_attribute():
+    # Arrange
+    class Aliased:
+        name = alias_for_attribute('title')
+
+    obj = Aliased()
+
+    # Act & Assert
+    assert not hasattr(obj, 'name')
+    obj.title = 'first'
+    assert obj.name == 'first'
+    obj.name = 'second'
+    assert obj.title == 'second'
+    assert Aliased.name.__doc__ == 'Alias for title'
+
+
+def test_alias_for_property():
+    # Arrange
+    class Aliased:
+        name = alias_for_attribute('title')
+
+        @property
+        def title(self):
+            return self._title.upper()
+
+        @title.setter
+        def title(self, value):
+            self._title = value
+
+    obj = Aliased()
+
+    # Act & Assert
+    obj.name = 'aliased'
+    assert obj.title == 'ALIASED'
+    assert obj.name == 'ALIASED'
+
+
 @pytest.mark.parametrize("pair_one, pair_two, model", [(
     None,
     'string',
@@ -236,6 +276,41 @@ def test_equivalent_chrono_pairs(pair_one, pair_two, model):
     assert result is False
 
 
+@pytest.mark.parametrize('prefix', ['', ns['resqml2']])
+def test_extract_has_occurred_during(prefix):
+    # Arrange
+    root = rqet.Element(ns['resqml2'] + 'HorizonInterpretation')
+    hod = rqet.SubElement(root, prefix + 'HasOccuredDuring')
+    bottom = rqet.SubElement(hod, prefix + 'ChronoBottom')
+    rqet.SubElement(bottom, ns['eml'] + 'UUID').text = ' bottom-uuid '
+    top = rqet.SubElement(hod, prefix + 'ChronoTop')
+    rqet.SubElement(top, ns['eml'] + 'UUID').text = 'top-uuid'
+
+    # Act
+    pair = extract_has_occurred_during(root)
+    missing = extract_has_occurred_during(root, tag = 'NotPresent')
+
+    # Assert
+    assert pair == ('bottom-uuid', 'top-uuid')
+    assert missing == (None, None)
+    assert extract_has_occurred_during(None) == (None, None)
+    hod.remove(bottom)
+    assert extract_has_occurred_during(root) == (None, 'top-uuid')
+
+
+@pytest.mark.parametrize("pair_one, pair_two", [
+    (None, None),
+    ((None, None), (None, None)),
+    (('uuid_1', 'uuid_2'), ('uuid_1', 'uuid_2')),
+])
+def test_equivalent_chrono_pairs_true(pair_one, pair_two):
+    # Act
+    result = equivalent_chrono_pairs(pair_one, pair_two)
+
+    # Assert
+    assert result is True
+
+
 def test_equivalent_extra_metadata_false(tmp_model, mocker):
     # Arrange
     bf_1 = tmp_model
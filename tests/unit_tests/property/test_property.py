@@ -207,12 +207,12 @@ def test_property(tmp_path):
     ntg_uuid = model.uuid(obj_type = p1.resqml_type, title = 'NETGRS')
     assert ntg_uuid is not None
     p1p = rqp.Property(model, uuid = ntg_uuid)
-    assert np.all(p1p.array_ref() == p1.array_ref())
+    assert np.array_equal(p1p.array_ref(), p1.array_ref())
     assert p1p.uom() == 'm3/m3'
     facies_uuid = model.uuid(obj_type = p2.resqml_type, title = 'FACIES')
     assert facies_uuid is not None
     p2p = rqp.Property(model, uuid = facies_uuid)
-    assert np.all(p2p.array_ref() == p2.array_ref())
+    assert np.array_equal(p2p.array_ref(), p2.array_ref())
     assert p2p.null_value() is not None and p2p.null_value() == 0
     grid = model.grid()
     jiggle_parts = model.parts(title = 'jiggle', title_mode = 'starts')
@@ -323,6 +323,8 @@ def test_string_lookup():
     sl.create_xml()
     assert sl.length() == 5 if sl.stored_as_list else 4
     assert sl.get_string(3) == 'sandy'
+    assert sl.stored_as_list
+    assert sl.get_string(0) is None and sl.get_string(-1) is None and sl.get_string(5) is None
     assert sl.get_index_for_string('muddy') == 2
     d2 = {0: 'nothing', 27: 'something', 173: 'amazing', 1072: 'brilliant'}
     sl2 = rqp.StringLookup(model, int_to_str_dict = d2, title = 'head in the clouds')
@@ -331,6 +333,11 @@ def test_string_lookup():
     assert sl2.get_string(1072) == 'brilliant'
     assert sl2.get_string(555) is None
     assert sl2.get_index_for_string('amazing') == 173
+    assert sl2.get_index_for_string('unknown') is None
+    sl2.set_string(27, 'everything')
+    assert sl2.get_index_for_string('everything') == 27
+    assert sl2.get_index_for_string('something') is None
+    sl2.set_string(27, 'something')
     sl2.create_xml()
     assert set(model.titles(obj_type = 'StringTableLookup')) == set(['stargazing', 'head in the clouds'])
     assert sl != sl2
@@ -1893,8 +1900,8 @@ def test_indexable_i0_j0(example_model_with_properties):
     b_reload = pc.single_array_ref(indexable = 'J0')
 
     # Assert
-    assert np.all(a_reload == a)
-    assert np.all(b_reload == b)
+    assert np.array_equal(a_reload, a)
+    assert np.array_equal(b_reload, b)
 
 
 def test_facet_type_list(example_model_with_properties):
@@ -2549,7 +2556,7 @@ def test_surface_support(example_model_and_crs):
     assert ppf_reload is not None
     assert_array_almost_equal(tpf_reload, t_prop_float)
     assert_array_almost_equal(tpf2_reload, t_prop_float)
-    assert np.all(tpi_reload == t_prop_int)
+    assert np.array_equal(tpi_reload, t_prop_int)
     assert_array_almost_equal(ppf_reload, p_prop_float)
 
 
@@ -2592,7 +2599,7 @@ def test_point_set_support(example_model_and_crs):
     assert pf_reload is not None
     assert pi_reload is not None
     assert_array_almost_equal(pf_reload, prop_float)
-    assert np.all(pi_reload == prop_int)
+    assert np.array_equal(pi_reload, prop_int)
 
 
 def test_polyline_support_closed(example_model_and_crs):
@@ -2634,7 +2641,7 @@ def test_polyline_support_closed(example_model_and_crs):
     assert pf_reload is not None
     assert pi_reload is not None
     assert_array_almost_equal(pf_reload, prop_float)
-    assert np.all(pi_reload == prop_int)
+    assert np.array_equal(pi_reload, prop_int)
 
 
 def test_polyline_support_not_closed(example_model_and_crs):
@@ -2676,7 +2683,7 @@ def test_polyline_support_not_closed(example_model_and_crs):
     assert pf_reload is not None
     assert pi_reload is not None
     assert_array_almost_equal(pf_reload, prop_float)
-    assert np.all(pi_reload == prop_int)
+    assert np.array_equal(pi_reload, prop_int)
 
 
 def test_polyline_set_support_all_closed(example_model_and_crs):
@@ -2727,7 +2734,7 @@ def test_polyline_set_support_all_closed(example_model_and_crs):
     assert pf_reload is not None
     assert pi_reload is not None
     assert_array_almost_equal(pf_reload, prop_float)
-    assert np.all(pi_reload == prop_int)
+    assert np.array_equal(pi_reload, prop_int)
 
 
 def test_polyline_set_support_all_not_closed(example_model_and_crs):
@@ -2778,7 +2785,7 @@ def test_polyline_set_support_all_not_closed(example_model_and_crs):
     assert pf_reload is not None
     assert pi_reload is not None
     assert_array_almost_equal(pf_reload, prop_float)
-    assert np.all(pi_reload == prop_int)
+    assert np.array_equal(pi_reload, prop_int)
 
 
 def test_polyline_set_support_most_closed(example_model_and_crs):
@@ -2829,7 +2836,7 @@ def test_polyline_set_support_most_closed(example_model_and_crs):
     assert pf_reload is not None
     assert pi_reload is not None
     assert_array_almost_equal(pf_reload, prop_float)
-    assert np.all(pi_reload == prop_int)
+    assert np.array_equal(pi_reload, prop_int)
 
 
 def test_polyline_set_support_most_not_closed(example_model_and_crs):
@@ -2880,7 +2887,7 @@ def test_polyline_set_support_most_not_closed(example_model_and_crs):
     assert pf_reload is not None
     assert pi_reload is not None
     assert_array_almost_equal(pf_reload, prop_float)
-    assert np.all(pi_reload == prop_int)
+    assert np.array_equal(pi_reload, prop_int)
 
 
 def test_pack_unpack_bits(example_model_with_properties):
@@ -2905,7 +2912,7 @@ def test_pack_unpack_bits(example_model_with_properties):
     pc.write_hdf5_for_imported_list(use_pack = True)
     pc.create_xml_for_imported_list_and_add_parts_to_model()
     model.store_epc()
-    assert np.all(pc.single_array_ref(property_kind = 'bisector') == array)
+    assert np.array_equal(pc.single_array_ref(property_kind = 'bisector'), array)
 
     model = rq.Model(model.epc_file)
     grid = model.grid()
@@ -2917,7 +2924,7 @@ def test_pack_unpack_bits(example_model_with_properties):
     pc = grid.extract_property_collection()
     a = pc.single_array_ref(property_kind = 'bisector', dtype = bool, use_pack = True)  # with unpacking
     assert a is not None and a.shape == (3, 5, 5)
-    assert np.all(a == array)
+    assert np.array_equal(a, array)
 
 
 def test_pack_unpack_bits_larger_aligned(example_model_and_crs):
@@ -2953,10 +2960,10 @@ def test_pack_unpack_bits_larger_aligned(example_model_and_crs):
     pc = grid.extract_property_collection()
     a = pc.single_array_ref(property_kind = 'shale', dtype = bool, use_pack = True)  # with unpacking
     assert a is not None and a.shape == shape
-    assert np.all(a == array)
+    assert np.array_equal(a, array)
     b = rqp.Property(model, uuid = bp.uuid).array_ref(dtype = bool)
     assert b is not None and b.shape == shape
-    assert np.all(b == brray)
+    assert np.array_equal(b, brray)
 
 
 def test_pack_unpack_bits_larger_unaligned(example_model_and_crs):
@@ -2992,10 +2999,10 @@ def test_pack_unpack_bits_larger_unaligned(example_model_and_crs):
     pc = grid.extract_property_collection()
     a = pc.single_array_ref(property_kind = 'shale', dtype = bool, use_pack = True)  # with unpacking
     assert a is not None and a.shape == shape
-    assert np.all(a == array)
+    assert np.array_equal(a, array)
     b = rqp.Property(model, uuid = bp.uuid).array_ref(dtype = bool)
     assert b is not None and b.shape == shape
-    assert np.all(b == brray)
+    assert np.array_equal(b, brray)
 
 
 def test_pack_unpack_bits_ni_one(example_model_and_crs):
@@ -3031,10 +3038,10 @@ def test_pack_unpack_bits_ni_one(example_model_and_crs):
     pc = grid.extract_property_collection()
     a = pc.single_array_ref(property_kind = 'shale', dtype = bool, use_pack = True)  # with unpacking
     assert a is not None and a.shape == shape
-    assert np.all(a == array)
+    assert np.array_equal(a, array)
     b = rqp.Property(model, uuid = bp.uuid).array_ref(dtype = bool)
     assert b is not None and b.shape == shape
-    assert np.all(b == brray)
+    assert np.array_equal(b, brray)
 
 
 def test_no_pack_unpack_bits_ni_one(example_model_and_crs):
@@ -3070,7 +3077,7 @@ def test_no_pack_unpack_bits_ni_one(example_model_and_crs):
     pc = grid.extract_property_collection()
     a = pc.single_array_ref(property_kind = 'shale', dtype = bool, use_pack = True)  # with unpacking
     assert a is not None and a.shape == shape
-    assert np.all(a == array)
+    assert np.array_equal(a, array)
     b = rqp.Property(model, uuid = bp.uuid).array_ref(dtype = bool)
     assert b is not None and b.shape == shape
-    assert np.all(b == brray)
+    assert np.array_equal(b, brray)
@@ -184,3 +184,32 @@ def test_strata(tmp_path):
         unit = strata_column_ri.unit_for_unit_index(grid.stratigraphic_units[grid.k_raw_index_array[k]])
         assert unit is not None
         assert unit.title == expected_unit_names_per_layer[k]
+
+
+def test_stratigraphic_unit_interpretation_same_uuid_equivalent(tmp_path):
+
+    epc = os.path.join(tmp_path, 'sui.epc')
+    model = rq.new_model(epc_file = epc)
+
+    suf = strata.StratigraphicUnitFeature(model, title = 'unit')
+    suf.create_xml()
+    sui = strata.StratigraphicUnitInterpretation(model,
+                                                 title = 'unit',
+                                                 stratigraphic_unit_feature = suf,
+                                                 deposition_mode = 'parallel to bottom')
+    sui.create_xml()
+
+    # a second instance for the same part, modified in memory, is still the same object
+    sui_b = strata.StratigraphicUnitInterpretation(model, uuid = sui.uuid)
+    sui_b.deposition_mode = 'parallel to top'
+    assert sui.is_equivalent(sui_b)
+    assert sui_b.is_equivalent(sui)
+    assert sui == sui_b
+
+    # a different object with the differing deposition mode is not equivalent
+    sui_c = strata.StratigraphicUnitInterpretation(model,
+                                                   title = 'unit',
+                                                   stratigraphic_unit_feature = suf,
+                                                   deposition_mode = 'parallel to top')
+    assert not sui.is_equivalent(sui_c)
+    assert sui != sui_c
@@ -33,6 +33,12 @@ def test_MdDatum(example_model_and_crs):
     assert identical == datum2
     assert different != datum2
 
+    # a datum reloaded with the same uuid is equivalent even if modified in memory
+    datum3 = resqpy.well.MdDatum(parent_model = model2, uuid = uuid)
+    datum3.location = (100.0, 100.0, 100.0)
+    assert datum3.is_equivalent(datum2)
+    assert datum3 == datum2
+
 
 @pytest.mark.parametrize('other_data,expected',
                          [(dict(location = (0, -99999, 3.14), md_reference = 'mean low water'), True),